@@ -1,90 +1,28 @@
+import asyncio
 import os
+import re
+import threading
+from functools import lru_cache
 
 from crewai import Agent, Crew, LLM, Task
 from crewai.tools import tool
 from logging_config import get_logger
+from llm_cache import cache_response, get_cached_response
 import requests
-from bs4 import BeautifulSoup
-import os
+from requests.adapters import HTTPAdapter
+from cachetools import LRUCache, TTLCache
 import json
-import google.generativeai as genai
 
-def fetch_url_content(url):
-    """
-    Fetch and parse content from a URL, preserving links in markdown format.
-    
-    Args:
-        url: The URL to fetch content from
-        
-    Returns:
-        str: The cleaned text content from the URL with links in markdown format, or an error message
-    """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Replace links with markdown-style links to preserve them
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
-            # Only convert links that have both text and href, and aren't anchors or javascript
-            if href and text and not href.startswith('#') and not href.startswith('javascript:'):
-                # Replace the link tag with markdown syntax
-                link.replace_with(f"[{text}]({href})")
-        
-        # Get text content
-        text = soup.get_text()
-        
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        return text
-    except Exception as e:
-        return f"Error fetching URL: {str(e)}"
+# Gemini model used by the CaPRA assessment tool
+CAPRA_MODEL = 'gemini-2.5-pro'
 
-
-@tool("(CaPRA) Catalyst Proposal Reviewing Assistant")
-def analyze_proposal_with_gemini(markdown_content: str) -> str:
-    """
-    Analyze a Cardano proposal using Gemini API's deep research feature.
-    This tool takes markdown content of a proposal and returns a comprehensive
-    JSON assessment based on Trust/Reliability, Context/Impact, and Financial criteria.
-    
-    Args:
-        markdown_content: The markdown content of the proposal
-        
-    Returns:
-        str: JSON formatted assessment of the proposal
-    """
-    try:
-        # Configure Gemini API
-        gemini_api_key = os.getenv("GEMINI_API_KEY")
-        if not gemini_api_key:
-            return json.dumps({"error": "GEMINI_API_KEY not configured"})
-        
-        genai.configure(api_key=gemini_api_key)
-        
-        # Use Gemini 2.5 Pro or Flash model for deep research
-        model = genai.GenerativeModel('gemini-2.5-pro')
-        
-        # Construct the prompt
-        prompt = f"""Role: "You are the 'Cardano Proposal Assessment Expert', an impartial, highly structured, and detail-oriented AI analyst."
+# Prompt for the CaPRA assessment; only the proposal content varies per call
+_CAPRA_PROMPT = """Role: "You are the 'Cardano Proposal Assessment Expert', an impartial, highly structured, and detail-oriented AI analyst."
 Goal: "Your sole function is to take raw proposal content (HTML/Markdown) and rigorously evaluate it against a fixed set of Trust/Reliability, Context/Impact, and Financial criteria. You must generate a consistent, structured output for downstream processing."
 Format Constraint: "You MUST output your response as a single, valid JSON object. Do not include any introductory text, markdown, or commentary outside of the JSON block."
 
 Proposal Content:
-{markdown_content}
+{content}
 
 Generate a comprehensive assessment in the following JSON format:
 {{
@@ -118,59 +56,491 @@ Generate a comprehensive assessment in the following JSON format:
     {{"Criteria": "Likelihood of Fast Implementation & Commercial Return", "Score": "(+)/(-)", "Rationale": ""}}
   ]
 }}"""
+
+# Captures a response's body inside an optional ```json (or bare ```) fence;
+# either fence may be missing, e.g. when the model omits the closing one
+_JSON_FENCE_RE = re.compile(r'^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL | re.IGNORECASE)
+
+# Matches the charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Upper bound on the raw page bytes downloaded per URL
+MAX_FETCH_BYTES = 2 * 1024 * 1024
+# Upper bound on the cleaned text returned per URL
+MAX_CONTENT_CHARS = 10_000
+# Amount of page text the crew puts into its task prompts
+SCRAPE_CONTENT_CHARS = 8000
+
+# Links with these href prefixes are left as plain text
+_SKIPPED_LINK_PREFIXES = ('#', 'javascript:')
+
+# Cleaned page text keyed by (url, max_chars); entries are served without
+# touching the network until they expire
+_URL_CACHE = TTLCache(maxsize=512, ttl=900)
+# (etag, last_modified, text) kept past expiry so stale entries can be
+# revalidated with a conditional GET instead of being re-downloaded
+_URL_VALIDATORS = LRUCache(maxsize=512)
+# Crews may fetch from several threads at once
+_URL_CACHE_LOCK = threading.Lock()
+
+# Browser-like User-Agent sent with every page fetch
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Shared requests session so sync fetches reuse pooled keep-alive connections
+# (and TLS sessions) instead of reconnecting for every URL
+_REQUESTS_SESSION = requests.Session()
+_REQUESTS_SESSION.headers.update({'User-Agent': _USER_AGENT})
+_REQUESTS_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+_REQUESTS_SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+
+# Shared aiohttp session for async fetches, bound to the event loop that created it
+_AIOHTTP_SESSION = None
+_AIOHTTP_SESSION_LOOP = None
+
+
+def _read_capped(response, max_bytes=MAX_FETCH_BYTES):
+    """
+    Read a streamed response body, stopping once max_bytes have been received.
+    
+    Args:
+        response: A requests response opened with stream=True
+        max_bytes: The maximum number of bytes to read
         
-        # Generate content with Gemini
-        response = model.generate_content(prompt)
+    Returns:
+        bytes: The (possibly truncated) response body
+    """
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=32 * 1024):
+        chunks.append(chunk)
+        received += len(chunk)
+        if received >= max_bytes:
+            break
+    return b''.join(chunks)[:max_bytes]
+
+
+async def _read_capped_async(response, max_bytes=MAX_FETCH_BYTES):
+    """
+    Read an aiohttp response body, stopping once max_bytes have been received.
+    
+    Args:
+        response: An aiohttp client response
+        max_bytes: The maximum number of bytes to read
         
-        # Extract the JSON from the response
-        response_text = response.text.strip()
+    Returns:
+        bytes: The (possibly truncated) response body
+    """
+    chunks = []
+    received = 0
+    async for chunk in response.content.iter_chunked(32 * 1024):
+        chunks.append(chunk)
+        received += len(chunk)
+        if received >= max_bytes:
+            break
+    return b''.join(chunks)[:max_bytes]
+
+
+def get_http_session():
+    """
+    Get the shared aiohttp session for the running event loop, creating it on first use.
+    
+    Sessions cannot be shared across event loops, so a new one is created if
+    the running loop differs from the one the current session was created on.
+    
+    Returns:
+        aiohttp.ClientSession: The shared client session
+    """
+    import aiohttp
+    
+    global _AIOHTTP_SESSION, _AIOHTTP_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _AIOHTTP_SESSION is None or _AIOHTTP_SESSION.closed or _AIOHTTP_SESSION_LOOP is not loop:
+        _AIOHTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=32),
+            headers={'User-Agent': _USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        _AIOHTTP_SESSION_LOOP = loop
+    return _AIOHTTP_SESSION
+
+
+async def close_http_session():
+    """
+    Close the shared aiohttp session, if one is open on the running event loop.
+    """
+    global _AIOHTTP_SESSION, _AIOHTTP_SESSION_LOOP
+    if _AIOHTTP_SESSION is not None and _AIOHTTP_SESSION_LOOP is asyncio.get_running_loop():
+        await _AIOHTTP_SESSION.close()
+    _AIOHTTP_SESSION = None
+    _AIOHTTP_SESSION_LOOP = None
+
+
+def _html_to_markdown(body, max_chars=MAX_CONTENT_CHARS, charset=None):
+    """
+    Extract the readable text from an HTML document, rewriting links to markdown.
+    
+    Args:
+        body: The raw HTML document as bytes
+        max_chars: The maximum number of characters of cleaned text to return
+        charset: The charset declared in the HTTP Content-Type header, or None
+            to detect it from a BOM or <meta charset> (falling back to UTF-8)
+        
+    Returns:
+        str: The cleaned text content with links in markdown format
+    """
+    from selectolax.lexbor import LexborHTMLParser
+    
+    # An HTTP-declared charset takes precedence over anything in the document
+    if charset:
+        try:
+            body = body.decode(charset, errors='replace')
+        except LookupError:
+            # Unknown charset declared by the server; fall back to detection
+            pass
+    
+    tree = LexborHTMLParser(body, encoding=True)
+    
+    # Remove script/style elements and page chrome (navigation, footers)
+    for node in tree.css('script, style, nav, footer'):
+        node.decompose()
+    
+    # Restrict extraction to the main content area when the page marks one up,
+    # skipping empty containers (e.g. a client-rendered <main> placeholder).
+    # An <article> is only used when it is the page's sole one; with several,
+    # narrowing to the first would drop the others and the text around them.
+    articles = tree.css('article')
+    article = articles[0] if len(articles) == 1 else None
+    candidates = (tree.css_first('main'), article, tree.body, tree.root)
+    root = next((node for node in candidates if node is not None and node.text().strip()), None)
+    if root is None:
+        return ''
+    
+    # Replace links with markdown-style links to preserve them; anchors and
+    # javascript links are filtered on href before any text is extracted.
+    # `attrs` looks up the single attribute lazily, whereas `attributes`
+    # would build a dict of every attribute on each link.
+    for link in root.css('a[href]'):
+        href = link.attrs['href']
+        if not href or href.startswith(_SKIPPED_LINK_PREFIXES):
+            continue
+        text = link.text(strip=True)
+        if text:
+            # Replace the link tag with markdown syntax
+            link.replace_with(f"[{text}]({href})")
+    
+    # Get text content
+    text = root.text()
+    
+    # Clean up whitespace: double spaces become line breaks, then one pass over the lines
+    lines = (line.strip() for line in text.replace("  ", "\n").splitlines())
+    text = '\n'.join(line for line in lines if line)
+    
+    return text[:max_chars]
+
+
+def _content_kind(content_type):
+    """
+    Classify a response by its Content-Type header before reading the body.
+    
+    Args:
+        content_type: The Content-Type header value (may be empty)
+        
+    Returns:
+        str: 'html' for HTML (or an unlabelled response), 'text' for other textual types
+        
+    Raises:
+        ValueError: For binary types such as PDFs or images, which can't be scraped
+    """
+    content_type = content_type.lower()
+    if not content_type or 'html' in content_type:
+        return 'html'
+    if content_type.startswith('text/') or 'json' in content_type or 'xml' in content_type:
+        return 'text'
+    if 'pdf' in content_type:
+        raise ValueError("URL points to a PDF document; please provide the URL of the HTML proposal page")
+    raise ValueError(f"Unsupported content type '{content_type}'; please provide the URL of an HTML page")
+
+
+def _declared_charset(content_type):
+    """
+    Extract the charset parameter from a Content-Type header.
+    
+    Unlike requests' response.encoding, this does not fall back to ISO-8859-1
+    for text/* responses, so undeclared HTML can still be detected from its
+    <meta charset>.
+    
+    Args:
+        content_type: The Content-Type header value (may be empty)
         
-        # Try to extract JSON if wrapped in markdown code blocks
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]  # Remove ```json
-        if response_text.startswith("```"):
-            response_text = response_text[3:]  # Remove ```
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]  # Remove trailing ```
+    Returns:
+        str: The declared charset, or None if the header doesn't declare one
+    """
+    match = _CHARSET_RE.search(content_type)
+    return match.group(1) if match else None
+
+
+def _render_body(body, kind, charset, max_chars=MAX_CONTENT_CHARS):
+    """
+    Turn a downloaded body into the text handed to the crew.
+    
+    Args:
+        body: The raw response body
+        kind: The result of _content_kind for the response
+        charset: The charset declared in the Content-Type header, or None
+        max_chars: The maximum number of characters of text to return
         
-        response_text = response_text.strip()
+    Returns:
+        str: Cleaned markdown for HTML, or the decoded body for other textual types
+    """
+    if kind == 'html':
+        return _html_to_markdown(body, max_chars, charset)
+    try:
+        return body.decode(charset or 'utf-8', errors='replace')[:max_chars]
+    except LookupError:
+        # Unknown charset declared by the server
+        return body.decode('utf-8', errors='replace')[:max_chars]
+
+
+def _cache_lookup(key):
+    """
+    Look up a page in the URL cache.
+    
+    Args:
+        key: The (url, max_chars) cache key
+        
+    Returns:
+        tuple: The fresh cached text (or None) and the stored
+            (etag, last_modified, text) validators (or None)
+    """
+    with _URL_CACHE_LOCK:
+        return _URL_CACHE.get(key), _URL_VALIDATORS.get(key)
+
+
+def _cache_store(key, text, validators):
+    """
+    Store freshly fetched or revalidated page text in the URL cache.
+    
+    Args:
+        key: The (url, max_chars) cache key
+        text: The cleaned page text
+        validators: The (etag, last_modified, text) tuple used for revalidation
+    """
+    with _URL_CACHE_LOCK:
+        _URL_CACHE[key] = text
+        _URL_VALIDATORS[key] = validators
+
+
+def _conditional_headers(validators):
+    """
+    Build the conditional-request headers for revalidating a cached page.
+    
+    Args:
+        validators: The stored (etag, last_modified, text) tuple, or None
+        
+    Returns:
+        dict: If-None-Match/If-Modified-Since headers, empty when there is nothing to revalidate
+    """
+    headers = {}
+    if validators is not None:
+        etag, last_modified, _ = validators
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def fetch_url_content(url, max_chars=MAX_CONTENT_CHARS):
+    """
+    Fetch and parse content from a URL, preserving links in markdown format.
+    
+    The body is streamed and the download is abandoned after MAX_FETCH_BYTES,
+    so very large pages cannot stall the scraper or blow up memory. Results are
+    cached for 15 minutes; once an entry expires the page is revalidated with
+    its ETag/Last-Modified headers and only re-parsed if it actually changed.
+    
+    Args:
+        url: The URL to fetch content from
+        max_chars: The maximum number of characters of cleaned text to return
+        
+    Returns:
+        str: The cleaned text content from the URL with links in markdown format, or an error message
+    """
+    key = (url, max_chars)
+    cached, validators = _cache_lookup(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        headers = _conditional_headers(validators)
+        
+        with _REQUESTS_SESSION.get(url, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304 and validators is not None:
+                # Unchanged since we last parsed it
+                text = validators[2]
+            else:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                kind = _content_kind(content_type)
+                text = _render_body(_read_capped(response), kind, _declared_charset(content_type), max_chars)
+                validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'), text)
+        
+        _cache_store(key, text, validators)
+        return text
+    except Exception as e:
+        return f"Error fetching URL: {str(e)}"
+
+
+async def fetch_url_content_async(url, max_chars=MAX_CONTENT_CHARS):
+    """
+    Async variant of fetch_url_content using the shared aiohttp session.
+    
+    Shares the page cache with fetch_url_content, so a URL fetched by either
+    variant is served from the cache by both.
+    
+    Args:
+        url: The URL to fetch content from
+        max_chars: The maximum number of characters of cleaned text to return
+        
+    Returns:
+        str: The cleaned text content from the URL with links in markdown format, or an error message
+    """
+    key = (url, max_chars)
+    cached, validators = _cache_lookup(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        headers = _conditional_headers(validators)
+        
+        async with get_http_session().get(url, headers=headers) as response:
+            if response.status == 304 and validators is not None:
+                # Unchanged since we last parsed it
+                text = validators[2]
+            else:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                kind = _content_kind(content_type)
+                body = await _read_capped_async(response)
+                # Parsing up to MAX_FETCH_BYTES of HTML is CPU-bound; keep it off the event loop
+                text = await asyncio.to_thread(_render_body, body, kind, _declared_charset(content_type), max_chars)
+                validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'), text)
+        
+        _cache_store(key, text, validators)
+        return text
+    except Exception as e:
+        return f"Error fetching URL: {str(e)}"
+
+
+@lru_cache(maxsize=1)
+def _capra_model():
+    """
+    Configure the Gemini API and create the CaPRA model, once per process.
+    
+    Returns:
+        GenerativeModel: The Gemini model used for proposal assessments
+        
+    Raises:
+        RuntimeError: If GEMINI_API_KEY is not configured (not cached, so a
+            key set later is picked up on the next call)
+    """
+    import google.generativeai as genai
+    
+    # Configure Gemini API
+    gemini_api_key = os.getenv("GEMINI_API_KEY")
+    if not gemini_api_key:
+        raise RuntimeError("GEMINI_API_KEY not configured")
+    
+    genai.configure(api_key=gemini_api_key)
+    
+    # Use Gemini 2.5 Pro or Flash model for deep research
+    return genai.GenerativeModel(CAPRA_MODEL)
+
+
+@tool("(CaPRA) Catalyst Proposal Reviewing Assistant")
+def analyze_proposal_with_gemini(markdown_content: str) -> str:
+    """
+    Analyze a Cardano proposal using Gemini API's deep research feature.
+    This tool takes markdown content of a proposal and returns a comprehensive
+    JSON assessment based on Trust/Reliability, Context/Impact, and Financial criteria.
+    
+    Args:
+        markdown_content: The markdown content of the proposal
+        
+    Returns:
+        str: JSON formatted assessment of the proposal
+    """
+    try:
+        try:
+            model = _capra_model()
+        except RuntimeError as e:
+            return json.dumps({"error": str(e)})
+        
+        # Construct the prompt
+        prompt = _CAPRA_PROMPT.format(content=markdown_content)
+        
+        # Identical proposals get identical prompts, so reuse earlier assessments
+        cached = get_cached_response(CAPRA_MODEL, prompt)
+        if cached is not None:
+            return cached
+        
+        # Generate content with Gemini
+        response = model.generate_content(prompt)
+        
+        # Extract the JSON from the response, unwrapping a markdown code fence if present
+        response_text = _JSON_FENCE_RE.match(response.text).group(1)
         
         # Validate it's valid JSON
         json.loads(response_text)
         
+        cache_response(CAPRA_MODEL, prompt, response_text)
+        
         return response_text
     except Exception as e:
         return json.dumps({"error": f"Error analyzing proposal: {str(e)}"})
 
 
 
+@lru_cache(maxsize=1)
+def _shared_llm():
+    """
+    Create the LLM used by the crew agents, once per process.
+    
+    Model, API key and temperature never change between crews, so all crews
+    share one instance and litellm can keep its HTTP clients warm. Call
+    _shared_llm.cache_clear() after rotating GEMINI_API_KEY.
+    
+    Returns:
+        LLM: The shared CrewAI LLM
+    """
+    return LLM(
+        model="gemini/gemini-2.5-flash",
+        api_key=os.getenv("GEMINI_API_KEY"),
+        temperature=0.1,
+    )
+
+
 class ResearchCrew:
-    def __init__(self, verbose=True, logger=None):
+    def __init__(self, verbose=True, logger=None, max_rpm=None):
         self.verbose = verbose
         self.logger = logger or get_logger(__name__)
+        # Per-crew cap on LLM requests per minute (None means unlimited)
+        self.max_rpm = max_rpm
         self.crew = None
         self.logger.info("ResearchCrew initialized")
 
-    def create_crew(self, url):
+    def _create_agents(self, url):
         """
-        Create a crew to transform URL content to markdown and analyze it.
+        Create the agents used by the crew.
         
         Args:
-            url: The URL to fetch and transform
+            url: The URL the crew will process
             
         Returns:
-            Crew: A configured CrewAI crew with agents and tasks
+            tuple: The content scraper, markdown formatter, structure analyst,
+                proposal assessor, and report writer agents
         """
-        self.logger.info(f"Creating URL to markdown crew for: {url}")
-        
-        # Fetch content from URL
-        url_content = fetch_url_content(url)
-
-        llm = LLM(
-            model="gemini/gemini-2.5-flash",
-            api_key=os.getenv("GEMINI_API_KEY"),
-            temperature=0.1,
-        )
+        llm = _shared_llm()
         # Create Content Scraper Agent
         content_scraper = Agent(
             role='Content Scraper',
@@ -195,6 +565,18 @@ class ResearchCrew:
             llm=llm
         )
         
+        # Create Proposal Structure Analyst Agent
+        structure_analyst = Agent(
+            role='Proposal Structure Analyst',
+            goal='List the section structure of the proposal page so the assessment can verify completeness',
+            backstory='You are a meticulous editor who quickly maps out how a document is organised. '
+                      'You report the sections and headings a page contains exactly as written, '
+                      'without summarising or judging their content.',
+            verbose=self.verbose,
+            allow_delegation=False,
+            llm=llm
+        )
+        
         # Create Cardano Proposal Assessment Expert Agent
         proposal_assessor = Agent(
             role='Cardano Proposal Assessment Expert',
@@ -220,7 +602,29 @@ class ResearchCrew:
             llm=llm
         )
         
-        self.logger.info("Created content scraper, markdown formatter, proposal assessor, and report writer agents")
+        self.logger.info("Created content scraper, markdown formatter, structure analyst, proposal assessor, and report writer agents")
+        
+        return content_scraper, markdown_formatter, structure_analyst, proposal_assessor, report_writer
+
+    async def create_crew(self, url):
+        """
+        Create a crew to transform URL content to markdown and analyze it.
+        
+        Args:
+            url: The URL to fetch and transform
+            
+        Returns:
+            Crew: A configured CrewAI crew with agents and tasks
+        """
+        self.logger.info(f"Creating URL to markdown crew for: {url}")
+        
+        # Fetch the URL content on the event loop while the agents are built in a
+        # worker thread; the agents don't depend on the content
+        url_content, agents = await asyncio.gather(
+            fetch_url_content_async(url, max_chars=SCRAPE_CONTENT_CHARS),
+            asyncio.to_thread(self._create_agents, url),
+        )
+        content_scraper, markdown_formatter, structure_analyst, proposal_assessor, report_writer = agents
         
         # Task to scrape exact content
         scrape_task = Task(
@@ -228,7 +632,7 @@ class ResearchCrew:
             Scrape the following web content from {url} and extract ALL details exactly as they appear:
             
             Content:
-            {url_content[:8000]}  
+            {url_content}
             
             Extract the exact details including:
             - Main title/heading (exact text)
@@ -263,7 +667,29 @@ class ResearchCrew:
             Create a comprehensive markdown document with the exact details including all links.
             """,
             agent=markdown_formatter,
-            expected_output='A well-formatted markdown document containing all exact details from the webpage without analysis, with all links preserved in markdown format'
+            expected_output='A well-formatted markdown document containing all exact details from the webpage without analysis, with all links preserved in markdown format',
+            context=[scrape_task],
+            async_execution=True  # Runs in parallel with structural_precheck_task
+        )
+        
+        # Task to outline the proposal structure straight from the page content
+        structural_precheck_task = Task(
+            description=f"""
+            List every section and subsection heading found in the following web content from {url}:
+            
+            Content:
+            {url_content}
+            
+            For each heading:
+            - Give the exact heading text as it appears on the page
+            - Indicate its nesting level (section or subsection)
+            - Note whether the section has any content under it or is empty
+            
+            DO NOT summarize, analyze, or rewrite the content. Only report the structure.
+            """,
+            agent=structure_analyst,
+            expected_output='An ordered outline of all section and subsection headings on the page, each marked as filled or empty',
+            async_execution=True  # Runs in parallel with markdown_task
         )
         
         # Task to analyze the proposal with Gemini
@@ -272,7 +698,8 @@ class ResearchCrew:
             Analyze the markdown proposal content using the (CaPRA) Catalyst Proposal Reviewing Assistant tool.
             
             You must:
-            1. Take the markdown content from the previous task (Markdown Documentation Specialist)
+            1. Take the markdown content from the Markdown Documentation Specialist
+               (use the section outline from the Proposal Structure Analyst only to check that no section is missing)
             2. Use the '(CaPRA) Catalyst Proposal Reviewing Assistant' tool to perform a deep assessment of the proposal
             3. The tool will use Gemini API's deep research capabilities to evaluate the proposal
             4. Return the JSON assessment exactly as provided by the tool
@@ -288,7 +715,7 @@ class ResearchCrew:
             """,
             agent=proposal_assessor,
             expected_output='A valid JSON object containing a comprehensive structured assessment of the Cardano proposal',
-            context=[markdown_task]  # This task depends on the markdown_task output
+            context=[markdown_task, structural_precheck_task]  # Joins both parallel branches
         )
         
         # Task to create professional markdown report from JSON assessment
@@ -326,12 +753,41 @@ class ResearchCrew:
             context=[assessment_task]  # This task depends on the assessment_task output
         )
         
-        # Create crew with all four tasks
+        # Create crew with all five tasks
         crew = Crew(
-            agents=[content_scraper, markdown_formatter, proposal_assessor, report_writer],
-            tasks=[scrape_task, markdown_task, assessment_task, report_task],
-            verbose=self.verbose
+            agents=[content_scraper, markdown_formatter, structure_analyst, proposal_assessor, report_writer],
+            tasks=[scrape_task, markdown_task, structural_precheck_task, assessment_task, report_task],
+            verbose=self.verbose,
+            max_rpm=self.max_rpm
         )
         
         self.logger.info("Crew setup completed")
         return crew
+
+    async def kickoff_many(self, urls, max_workers=8):
+        """
+        Create and run a crew for each URL concurrently.
+        
+        At most max_workers crews run at once. Every crew makes several Gemini
+        calls, so the effective request rate is roughly max_workers times the
+        per-crew rate; lower max_workers or set max_rpm on this ResearchCrew to
+        stay inside the Gemini RPM/TPM quota.
+        
+        Args:
+            urls: The URLs to process (duplicates are only processed once)
+            max_workers: The maximum number of crews running at the same time
+            
+        Returns:
+            dict: The crew output for each URL, keyed by URL
+        """
+        urls = list(dict.fromkeys(urls))
+        self.logger.info(f"Running {len(urls)} crews with up to {max_workers} in parallel")
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def run(url):
+            async with semaphore:
+                crew = await self.create_crew(url)
+                return await crew.kickoff_async()
+        
+        results = await asyncio.gather(*(run(url) for url in urls))
+        return dict(zip(urls, results))
@@ -0,0 +1,77 @@
+import hashlib
+import os
+
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default location for cached LLM responses (override with LLM_CACHE_DIR)
+DEFAULT_CACHE_DIR = "/tmp/capra_cache"
+# Cached responses expire after one day
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+_cache = None
+
+def get_cache():
+    """
+    Get the shared on-disk cache, opening it on first use
+
+    Returns:
+        Cache: The diskcache instance backing the LLM response cache
+    """
+    global _cache
+    if _cache is None:
+        from diskcache import Cache
+        _cache = Cache(os.getenv("LLM_CACHE_DIR", DEFAULT_CACHE_DIR))
+    return _cache
+
+def make_key(model_name, prompt):
+    """
+    Build the cache key for a prompt sent to a given model
+
+    Args:
+        model_name: The LLM model name, so a model bump invalidates old entries
+        prompt: The full prompt text sent to the model
+
+    Returns:
+        str: A hex SHA-256 digest identifying the request
+    """
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+def get_cached_response(model_name, prompt):
+    """
+    Look up a previously cached response
+
+    Args:
+        model_name: The LLM model name
+        prompt: The full prompt text sent to the model
+
+    Returns:
+        str: The cached response text, or None on a miss or if the cache is unavailable
+    """
+    try:
+        return get_cache().get(make_key(model_name, prompt))
+    except Exception as e:
+        # The cache only speeds things up; treat any failure as a miss
+        logger.warning(f"LLM cache lookup failed, treating as a miss: {str(e)}")
+        return None
+
+def cache_response(model_name, prompt, response_text, expire=DEFAULT_TTL_SECONDS):
+    """
+    Store a response so identical requests can skip the LLM round-trip
+
+    Args:
+        model_name: The LLM model name
+        prompt: The full prompt text sent to the model
+        response_text: The validated response to store
+        expire: Seconds until the entry expires (default: one day)
+    """
+    try:
+        get_cache().set(make_key(model_name, prompt), response_text, expire=expire)
+    except Exception as e:
+        # Never lose a valid response because it couldn't be cached
+        logger.warning(f"LLM cache write failed, skipping: {str(e)}")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uvicorn
 import uuid
@@ -6,7 +7,7 @@ from fastapi import FastAPI, Query, HTTPException
 from pydantic import BaseModel, Field, field_validator
 from masumi.config import Config
 from masumi.payment import Payment, Amount
-from crew_definition import ResearchCrew
+from crew_definition import ResearchCrew, close_http_session
 from logging_config import setup_logging
 
 # Configure logging
@@ -32,6 +33,11 @@ app = FastAPI(
     version="1.0.0"
 )
 
+@app.on_event("shutdown")
+async def shutdown():
+    """ Closes the shared HTTP session used to fetch proposal pages """
+    await close_http_session()
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Temporary in-memory job store (DO NOT USE IN PRODUCTION)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -74,8 +80,8 @@ async def execute_crew_task(input_data: dict) -> str:
     url = input_data.get("url", "")
     logger.info(f"Starting CrewAI task with URL: {url}")
     crew_instance = ResearchCrew(logger=logger)
-    crew = crew_instance.create_crew(url)
-    result = crew.kickoff()
+    crew = await crew_instance.create_crew(url)
+    result = await crew.kickoff_async()
     logger.info("CrewAI task completed successfully")
     return result
 
@@ -318,7 +324,14 @@ def main():
     
     # Initialize and run the crew
     crew_instance = ResearchCrew(verbose=True)
-    crew = crew_instance.create_crew(input_data['url'])
+
+    async def create_crew():
+        try:
+            return await crew_instance.create_crew(input_data['url'])
+        finally:
+            await close_http_session()
+
+    crew = asyncio.run(create_crew())
     result = crew.kickoff()
     
     # Display the result